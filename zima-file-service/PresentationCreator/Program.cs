@@ -0,0 +1,177 @@
+using System;
+using System.IO;
+using System.Security;
+using System.Text;
+using System.Text.Json;
+using DocumentFormat.OpenXml;
+using DocumentFormat.OpenXml.Packaging;
+using DocumentFormat.OpenXml.Wordprocessing;
+
+/// <summary>
+/// Renders a slide-style Word document from a JSON array of content blocks.
+/// Usage: dotnet exec PresentationCreator.dll &lt;output.docx&gt; &lt;content-json&gt;
+/// </summary>
+class Program
+{
+    const string DocumentXmlHeader =
+        "<?xml version=\"1.0\" encoding=\"utf-8\"?>" +
+        "<w:document xmlns:w=\"http://schemas.openxmlformats.org/wordprocessingml/2006/main\"><w:body>";
+
+    const string DocumentXmlFooter = "</w:body></w:document>";
+
+    // {0} = style id, {1} = run properties, {2} = escaped text
+    const string StyledParagraphXml =
+        "<w:p><w:pPr><w:pStyle w:val=\"{0}\"/></w:pPr><w:r>{1}<w:t xml:space=\"preserve\">{2}</w:t></w:r></w:p>";
+
+    const string PageBreakXml = "<w:p><w:r><w:br w:type=\"page\"/></w:r></w:p>";
+
+    static int Main(string[] args)
+    {
+        if (args.Length != 2)
+        {
+            Console.Error.WriteLine("Usage: PresentationCreator <output.docx> <content-json>");
+            return 1;
+        }
+
+        var filePath = args[0];
+        using var blocks = JsonDocument.Parse(args[1]);
+        CreatePresentation(filePath, blocks.RootElement);
+        Console.WriteLine($"✅ Presentation created successfully at: {filePath}");
+        return 0;
+    }
+
+    static void CreatePresentation(string filePath, JsonElement blocks)
+    {
+        using var document = WordprocessingDocument.Create(filePath, WordprocessingDocumentType.Document);
+
+        var mainPart = document.AddMainDocumentPart();
+        AddStyles(mainPart);
+
+        // The layout is fixed, so document.xml is rendered as text and written
+        // to the part in one go instead of building an OpenXml element tree.
+        var bytes = Encoding.UTF8.GetBytes(BuildDocumentXml(blocks));
+        using var stream = mainPart.GetStream(FileMode.Create);
+        stream.Write(bytes, 0, bytes.Length);
+    }
+
+    static string BuildDocumentXml(JsonElement blocks)
+    {
+        var xml = new StringBuilder(DocumentXmlHeader);
+
+        foreach (var block in blocks.EnumerateArray())
+        {
+            var type = block.GetProperty("type").GetString();
+            switch (type)
+            {
+                case "title":
+                    AppendStyledParagraph(xml, "Title", GetText(block));
+                    break;
+                case "subtitle":
+                    AppendStyledParagraph(xml, "Subtitle", GetText(block));
+                    break;
+                case "slide":
+                    AppendStyledParagraph(xml, "SlideHeader", GetText(block));
+                    break;
+                case "heading":
+                    AppendStyledParagraph(xml, "Heading2", GetText(block));
+                    break;
+                case "paragraph":
+                    AppendStyledParagraph(xml, "BodyText", GetText(block), GetFlag(block, "bold"), GetFlag(block, "italic"));
+                    break;
+                case "bullet":
+                    foreach (var item in block.GetProperty("items").EnumerateArray())
+                    {
+                        AppendStyledParagraph(xml, "Bullet", "• " + item.GetString());
+                    }
+                    break;
+                case "break":
+                    xml.Append(PageBreakXml);
+                    break;
+                default:
+                    throw new ArgumentException($"Unknown content block type: {type}");
+            }
+        }
+
+        return xml.Append(DocumentXmlFooter).ToString();
+    }
+
+    static void AppendStyledParagraph(StringBuilder xml, string styleId, string text, bool bold = false, bool italic = false)
+    {
+        var runProps = bold || italic
+            ? "<w:rPr>" + (bold ? "<w:b/>" : "") + (italic ? "<w:i/>" : "") + "</w:rPr>"
+            : "";
+        xml.AppendFormat(StyledParagraphXml, styleId, runProps, SecurityElement.Escape(text));
+    }
+
+    static string GetText(JsonElement block) => block.GetProperty("text").GetString() ?? "";
+
+    static bool GetFlag(JsonElement block, string name) =>
+        block.TryGetProperty(name, out var value) && value.ValueKind == JsonValueKind.True;
+
+    /// <summary>
+    /// Defines the presentation's formatting once in styles.xml so each
+    /// paragraph only carries a style reference.
+    /// </summary>
+    static void AddStyles(MainDocumentPart mainPart)
+    {
+        var stylesPart = mainPart.AddNewPart<StyleDefinitionsPart>();
+        stylesPart.Styles = new Styles(
+            CreateParagraphStyle("Title", "Title",
+                new StyleParagraphProperties(
+                    new SpacingBetweenLines { After = "480" },
+                    new Justification { Val = JustificationValues.Center }
+                ),
+                new StyleRunProperties(
+                    new Bold(),
+                    new FontSize { Val = "72" }
+                )),
+            CreateParagraphStyle("Subtitle", "Subtitle",
+                new StyleParagraphProperties(
+                    new SpacingBetweenLines { After = "240" },
+                    new Justification { Val = JustificationValues.Center }
+                ),
+                new StyleRunProperties(
+                    new Italic(),
+                    new FontSize { Val = "24" }
+                )),
+            CreateParagraphStyle("SlideHeader", "Slide Header",
+                new StyleParagraphProperties(
+                    new SpacingBetweenLines { Before = "240", After = "240" }
+                ),
+                new StyleRunProperties(
+                    new Bold(),
+                    new Color { Val = "1F4E79" },
+                    new FontSize { Val = "48" }
+                )),
+            CreateParagraphStyle("Heading2", "heading 2",
+                new StyleParagraphProperties(
+                    new SpacingBetweenLines { Before = "180", After = "120" }
+                ),
+                new StyleRunProperties(
+                    new Bold(),
+                    new FontSize { Val = "32" }
+                )),
+            CreateParagraphStyle("BodyText", "Body Text",
+                new StyleParagraphProperties(
+                    new SpacingBetweenLines { After = "120" }
+                ),
+                new StyleRunProperties()),
+            CreateParagraphStyle("Bullet", "Bullet",
+                new StyleParagraphProperties(
+                    new SpacingBetweenLines { After = "60" },
+                    new Indentation { Left = "720", Hanging = "360" }
+                ),
+                new StyleRunProperties())
+        );
+        stylesPart.Styles.Save();
+    }
+
+    static Style CreateParagraphStyle(string styleId, string name, StyleParagraphProperties paragraphProps, StyleRunProperties runProps)
+    {
+        return new Style(new StyleName { Val = name }, paragraphProps, runProps)
+        {
+            Type = StyleValues.Paragraph,
+            StyleId = styleId
+        };
+    }
+}
@@ -0,0 +1,45 @@
+# cython: language_level=3
+"""
+Compiled builder for the city entries of create_cities_word.py.
+
+Appends the heading, description and spacer paragraphs for each city
+directly with lxml SubElement calls, skipping python-docx's wrappers.
+Build in place with:
+
+    cythonize -i -3 _docbuild.pyx
+
+create_cities_word.py falls back to the pure-Python builder when the
+extension has not been built.
+"""
+from lxml import etree
+
+cdef object W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+cdef object P_TAG = W + "p"
+cdef object PPR_TAG = W + "pPr"
+cdef object PSTYLE_TAG = W + "pStyle"
+cdef object R_TAG = W + "r"
+cdef object T_TAG = W + "t"
+cdef object VAL_ATTR = W + "val"
+cdef object SPACE_ATTR = "{http://www.w3.org/XML/1998/namespace}space"
+
+
+cdef _paragraph(object body_elem, str text, str style):
+    p = etree.SubElement(body_elem, P_TAG)
+    if style is not None:
+        ppr = etree.SubElement(p, PPR_TAG)
+        etree.SubElement(ppr, PSTYLE_TAG).set(VAL_ATTR, style)
+    if text:
+        t = etree.SubElement(etree.SubElement(p, R_TAG), T_TAG)
+        t.text = text
+        if text != text.strip():
+            t.set(SPACE_ATTR, "preserve")
+
+
+cpdef build_cities(list cities, object body_elem):
+    """Append each city's Heading3 title, description and a spacer to body_elem."""
+    cdef Py_ssize_t i
+    for i in range(len(cities)):
+        city = cities[i]
+        _paragraph(body_elem, f"{i + 1}. {city['name']}", "Heading3")
+        _paragraph(body_elem, city['description'], None)
+        _paragraph(body_elem, None, None)
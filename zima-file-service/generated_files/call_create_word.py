@@ -1,8 +1,11 @@
 #!/usr/bin/env python3
 import json
-import subprocess
+import os
 import sys
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from mcp_client import get_client
+
 # Call the create_word MCP tool
 tool_call = {
     "jsonrpc": "2.0",
@@ -26,13 +29,8 @@ tool_call = {
     }
 }
 
-# Execute the tool call
-result = subprocess.run([
-    "dotnet", "run", "--project", "/Volumes/DATA/QWEN/zima-file-service",
-    "--", "create_word",
-    json.dumps(tool_call["params"]["arguments"])
-], capture_output=True, text=True, cwd="/Volumes/DATA/QWEN/zima-file-service")
+# Execute the tool call on the shared MCP server session
+params = tool_call["params"]
+result = get_client().call_tool(params["name"], params["arguments"])
 
-print("STDOUT:", result.stdout)
-print("STDERR:", result.stderr)
-print("Return code:", result.returncode)
\ No newline at end of file
+print("Response:", json.dumps(result))
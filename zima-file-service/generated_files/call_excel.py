@@ -1,6 +1,26 @@
 #!/usr/bin/env python3
+from concurrent.futures import ThreadPoolExecutor
+
 import requests
-import json
+from requests.adapters import HTTPAdapter
+
+API_URL = 'http://localhost:5000/api/tools/create_excel'
+
+# One keep-alive session shared by every call so sockets are reused
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(pool_connections=2, pool_maxsize=8, max_retries=0))
+
+
+def create_excel(payload):
+    """POST one create_excel payload and return the response."""
+    return SESSION.post(API_URL, json=payload)
+
+
+def create_excel_batch(payloads, max_workers=4):
+    """POST several payloads concurrently over the shared session."""
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(create_excel, payloads))
+
 
 # Product data
 data = {
@@ -23,7 +43,7 @@ data = {
 
 try:
     # Make API call to create Excel file
-    response = requests.post('http://localhost:5000/api/tools/create_excel', json=data)
+    response = create_excel(data)
     print(f"Status: {response.status_code}")
     print(f"Response: {response.text}")
 except Exception as e:
@@ -2,32 +2,9 @@
 """
 Create a Word document with five beautiful cities around the world.
 """
+import importlib.util
 
-try:
-    from docx import Document
-    from docx.shared import Inches
-    from docx.enum.text import WD_ALIGN_PARAGRAPH
-except ImportError:
-    import subprocess
-    import sys
-    print("Installing python-docx...")
-    subprocess.check_call([sys.executable, "-m", "pip", "install", "python-docx"])
-    from docx import Document
-    from docx.shared import Inches
-    from docx.enum.text import WD_ALIGN_PARAGRAPH
-
-# Create a new document
-doc = Document()
-
-# Add title
-title = doc.add_heading('Five Beautiful Cities Around the World', 0)
-title.alignment = WD_ALIGN_PARAGRAPH.CENTER
-
-# Add introduction paragraph
-intro = doc.add_paragraph()
-intro.add_run('Here are five amazing cities from different continents, each offering unique experiences and attractions:')
-
-# Add the five cities
+# The five cities
 cities = [
     {
         'name': 'Tokyo, Japan',
@@ -51,19 +28,48 @@ cities = [
     }
 ]
 
-# Add each city
-for i, city in enumerate(cities, 1):
-    p = doc.add_paragraph()
-    p.add_run(f"{i}. {city['name']} - ").bold = True
-    p.add_run(city['description'])
+output_path = "/Volumes/DATA/QWEN/zima-file-service/generated_files/cities.docx"
 
-# Add conclusion paragraph
-conclusion = doc.add_paragraph()
-conclusion.add_run('Each of these cities represents a unique blend of culture, history, and modern attractions that make them must-visit destinations for travelers from around the world.')
 
-# Save the document
-output_path = "/Volumes/DATA/QWEN/zima-file-service/generated_files/cities.docx"
-doc.save(output_path)
+def main():
+    # python-docx and lxml are imported here so importing this module stays cheap
+    from docx_xml import fresh_document, paragraph, replace_body, run
+
+    # Create a new document
+    doc = fresh_document()
+
+    # Title and introduction
+    body = [
+        paragraph(run('Five Beautiful Cities Around the World'), style='Title', center=True),
+        paragraph(run('Here are five amazing cities from different continents, each offering unique experiences and attractions:')),
+    ]
+
+    # Add each city
+    for i, city in enumerate(cities, 1):
+        body.append(paragraph(run(f"{i}. {city['name']} - ", bold=True), run(city['description'])))
+
+    # Add conclusion paragraph
+    body.append(paragraph(run('Each of these cities represents a unique blend of culture, history, and modern attractions that make them must-visit destinations for travelers from around the world.')))
+
+    # Build the whole body in a single parse
+    replace_body(doc, body)
+
+    # Save the document
+    doc.save(output_path)
+
+    print(f"Word document created successfully: {output_path}")
+    print(f"Document contains {len(cities)} cities with descriptions.")
+
+
+def ensure_python_docx():
+    """Install python-docx on first use when running as a script."""
+    if importlib.util.find_spec("docx") is None:
+        import subprocess
+        import sys
+        print("Installing python-docx...")
+        subprocess.check_call([sys.executable, "-m", "pip", "install", "python-docx"])
+
 
-print(f"Word document created successfully: {output_path}")
-print(f"Document contains {len(cities)} cities with descriptions.")
\ No newline at end of file
+if __name__ == "__main__":
+    ensure_python_docx()
+    main()
@@ -1,24 +1,20 @@
 #!/usr/bin/env python3
 
-from docx import Document
-from docx.shared import Inches
-from docx.enum.text import WD_ALIGN_PARAGRAPH
+from docx_xml import fresh_document, install_body, paragraph, parse_body, run
 
-# Create a new document
-doc = Document()
-
-# Add title
-title = doc.add_heading('Five Famous Cities', 0)
-title.alignment = WD_ALIGN_PARAGRAPH.CENTER
-
-# Add subtitle
-subtitle = doc.add_heading('A Collection of Notable World Cities', level=2)
-subtitle.alignment = WD_ALIGN_PARAGRAPH.CENTER
+try:
+    from _docbuild import build_cities
+except ImportError:
+    def build_cities(cities, body_elem):
+        """Pure-Python fallback for the compiled _docbuild.build_cities."""
+        fragments = []
+        for i, city in enumerate(cities, 1):
+            fragments.append(paragraph(run(f"{i}. {city['name']}"), style='Heading3'))
+            fragments.append(paragraph(run(city['description'])))
+            fragments.append(paragraph())
+        body_elem.extend(list(parse_body(fragments)))
 
-# Add introduction paragraph
-doc.add_paragraph('Here are five remarkable cities from different continents, each with its own unique character and attractions:')
-
-# Add the five cities with descriptions
+# The five cities with descriptions
 cities = [
     {
         'name': 'London, United Kingdom',
@@ -42,19 +38,25 @@ cities = [
     }
 ]
 
-# Add each city as a numbered list item with description
-for i, city in enumerate(cities, 1):
-    # Add city name as a heading
-    city_heading = doc.add_heading(f"{i}. {city['name']}", level=3)
+# Create a new document
+doc = fresh_document()
 
-    # Add description paragraph
-    doc.add_paragraph(city['description'])
+# Title, subtitle and introduction
+body = parse_body([
+    paragraph(run('Five Famous Cities'), style='Title', center=True),
+    paragraph(run('A Collection of Notable World Cities'), style='Heading2', center=True),
+    paragraph(run('Here are five remarkable cities from different continents, each with its own unique character and attractions:')),
+])
 
-    # Add a small space between entries
-    doc.add_paragraph("")
+# Add each city as a numbered heading, its description and a spacer
+build_cities(cities, body)
 
 # Add closing paragraph
-doc.add_paragraph('These five cities represent different cultures, architectural styles, and geographical regions, making them fascinating destinations for travelers and urban enthusiasts alike.')
+body.extend(list(parse_body([
+    paragraph(run('These five cities represent different cultures, architectural styles, and geographical regions, making them fascinating destinations for travelers and urban enthusiasts alike.')),
+])))
+
+install_body(doc, body)
 
 # Save the document
 output_path = 'generated_files/five_cities.docx'
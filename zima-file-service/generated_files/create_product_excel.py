@@ -1,59 +1,310 @@
 #!/usr/bin/env python3
-import openpyxl
-from openpyxl.styles import Font, PatternFill, Alignment
-from openpyxl.utils import get_column_letter
+"""
+Write product_data.xlsx by emitting the OOXML parts directly.
 
-# Create a new workbook and select the active sheet
-wb = openpyxl.Workbook()
-ws = wb.active
-ws.title = "Product Data"
+The sheet has a fixed shape (one styled header row, alternating row shading),
+so instead of going through a general-purpose writer the parts are rendered
+from string templates and zipped with a fast compression level.
+"""
+import io
+import json
+import math
+import os
+import re
+import sys
+import tempfile
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+from string import ascii_uppercase
+from xml.sax.saxutils import escape
+
+output_path = "/Volumes/DATA/QWEN/zima-file-service/generated_files/product_data.xlsx"
+
+# Column widths: longest value in each column plus padding. The data below is
+# fixed, so these are worked out once rather than measured on every run;
+# update them together with headers/rows.
+COLUMN_WIDTHS = (12, 17, 17, 10, 16, 16, 14)
 
 # Headers
-headers = ["Product ID", "Product Name", "Category", "Price", "Stock Quantity", "Supplier", "Last Updated"]
+headers = ("Product ID", "Product Name", "Category", "Price", "Stock Quantity", "Supplier", "Last Updated")
 
 # Product data rows
-rows = [
-    ["P001", "Laptop Computer", "Electronics", "$1299.99", 45, "TechCorp", "2026-01-15"],
-    ["P002", "Office Chair", "Furniture", "$249.99", 23, "ComfortSeating", "2026-01-20"],
-    ["P003", "Coffee Maker", "Appliances", "$89.99", 67, "BrewMaster", "2026-01-18"],
-    ["P004", "Wireless Mouse", "Electronics", "$29.99", 134, "TechCorp", "2026-01-22"],
-    ["P005", "Desk Lamp", "Furniture", "$45.99", 78, "LightWorks", "2026-01-16"],
-    ["P006", "Water Bottle", "Accessories", "$19.99", 89, "HydroLife", "2026-01-25"],
-    ["P007", "Keyboard", "Electronics", "$79.99", 56, "TechCorp", "2026-01-21"],
-    ["P008", "Plant Pot", "Home & Garden", "$12.99", 145, "GreenThumb", "2026-01-19"],
-    ["P009", "Notebook Set", "Office Supplies", "$15.99", 203, "PaperPlus", "2026-01-24"],
-    ["P010", "Phone Charger", "Electronics", "$24.99", 98, "PowerTech", "2026-01-23"]
-]
-
-# Add headers to the first row
-for col_num, header in enumerate(headers, 1):
-    cell = ws.cell(row=1, column=col_num, value=header)
-    cell.font = Font(bold=True, color="FFFFFF")
-    cell.fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
-    cell.alignment = Alignment(horizontal="center", vertical="center")
-
-# Add data rows
-for row_num, row_data in enumerate(rows, 2):
-    for col_num, value in enumerate(row_data, 1):
-        cell = ws.cell(row=row_num, column=col_num, value=value)
-        # Alternate row colors
-        if row_num % 2 == 0:
-            cell.fill = PatternFill(start_color="F2F2F2", end_color="F2F2F2", fill_type="solid")
-
-# Auto-adjust column widths
-for col in ws.columns:
-    max_length = 0
-    column = col[0].column_letter
-    for cell in col:
-        try:
-            if len(str(cell.value)) > max_length:
-                max_length = len(str(cell.value))
-        except:
-            pass
-    adjusted_width = (max_length + 2)
-    ws.column_dimensions[column].width = adjusted_width
-
-# Save the file
-output_path = "/Volumes/DATA/QWEN/zima-file-service/generated_files/product_data.xlsx"
-wb.save(output_path)
-print(f"Excel file created successfully: {output_path}")
\ No newline at end of file
+rows = (
+    ("P001", "Laptop Computer", "Electronics", "$1299.99", 45, "TechCorp", "2026-01-15"),
+    ("P002", "Office Chair", "Furniture", "$249.99", 23, "ComfortSeating", "2026-01-20"),
+    ("P003", "Coffee Maker", "Appliances", "$89.99", 67, "BrewMaster", "2026-01-18"),
+    ("P004", "Wireless Mouse", "Electronics", "$29.99", 134, "TechCorp", "2026-01-22"),
+    ("P005", "Desk Lamp", "Furniture", "$45.99", 78, "LightWorks", "2026-01-16"),
+    ("P006", "Water Bottle", "Accessories", "$19.99", 89, "HydroLife", "2026-01-25"),
+    ("P007", "Keyboard", "Electronics", "$79.99", 56, "TechCorp", "2026-01-21"),
+    ("P008", "Plant Pot", "Home & Garden", "$12.99", 145, "GreenThumb", "2026-01-19"),
+    ("P009", "Notebook Set", "Office Supplies", "$15.99", 203, "PaperPlus", "2026-01-24"),
+    ("P010", "Phone Charger", "Electronics", "$24.99", 98, "PowerTech", "2026-01-23"),
+)
+
+
+# Static package parts
+CONTENT_TYPES_XML = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">\
+<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>\
+<Default Extension="xml" ContentType="application/xml"/>\
+<Override PartName="/xl/workbook.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>\
+<Override PartName="/xl/worksheets/sheet1.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>\
+<Override PartName="/xl/styles.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>\
+<Override PartName="/xl/sharedStrings.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sharedStrings+xml"/>\
+</Types>"""
+
+ROOT_RELS_XML = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">\
+<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="xl/workbook.xml"/>\
+</Relationships>"""
+
+WORKBOOK_XML = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" \
+xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">\
+<sheets><sheet name="Product Data" sheetId="1" r:id="rId1"/></sheets>\
+</workbook>"""
+
+WORKBOOK_RELS_XML = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">\
+<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" Target="worksheets/sheet1.xml"/>\
+<Relationship Id="rId2" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" Target="styles.xml"/>\
+<Relationship Id="rId3" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/sharedStrings" Target="sharedStrings.xml"/>\
+</Relationships>"""
+
+# Cell formats: s="0" default, s="1" header (bold white on blue, centered),
+# s="2" shaded data row, then currency and date formats without and with
+# shading
+HEADER_STYLE = 1
+
+# How each column is stored: its value type and its (plain, shaded) cell
+# format. Price and Last Updated are written as numbers so Excel can sort
+# and sum them; rows still carry them as "$1299.99" and ISO date strings.
+COLUMN_KINDS = ("text", "text", "text", "currency", "number", "text", "date")
+KIND_STYLES = {
+    "text": (0, 2),
+    "number": (0, 2),
+    "currency": (3, 4),
+    "date": (5, 6),
+}
+
+# Characters XML 1.0 does not allow in text; they would make the part unparseable
+ILLEGAL_XML_CHARS = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f\ufffe\uffff]")
+
+# Day zero of Excel's 1900 date system, as used for serial date numbers.
+# Excel counts a nonexistent 1900-02-29, so the offset only holds from
+# 1900-03-01; earlier dates have no serial Excel shows correctly.
+EXCEL_EPOCH = date(1899, 12, 30)
+FIRST_SERIAL_DATE = date(1900, 3, 1)
+
+STYLES_XML = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<styleSheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">\
+<numFmts count="2">\
+<numFmt numFmtId="164" formatCode="&quot;$&quot;#,##0.00"/>\
+<numFmt numFmtId="165" formatCode="yyyy-mm-dd"/>\
+</numFmts>\
+<fonts count="2">\
+<font><sz val="11"/><name val="Calibri"/><family val="2"/><scheme val="minor"/></font>\
+<font><b/><sz val="11"/><color rgb="FFFFFFFF"/><name val="Calibri"/><family val="2"/><scheme val="minor"/></font>\
+</fonts>\
+<fills count="4">\
+<fill><patternFill patternType="none"/></fill>\
+<fill><patternFill patternType="gray125"/></fill>\
+<fill><patternFill patternType="solid"><fgColor rgb="FF4472C4"/><bgColor rgb="FF4472C4"/></patternFill></fill>\
+<fill><patternFill patternType="solid"><fgColor rgb="FFF2F2F2"/><bgColor rgb="FFF2F2F2"/></patternFill></fill>\
+</fills>\
+<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border></borders>\
+<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>\
+<cellXfs count="7">\
+<xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>\
+<xf numFmtId="0" fontId="1" fillId="2" borderId="0" xfId="0" applyFont="1" applyFill="1" applyAlignment="1">\
+<alignment horizontal="center" vertical="center"/></xf>\
+<xf numFmtId="0" fontId="0" fillId="3" borderId="0" xfId="0" applyFill="1"/>\
+<xf numFmtId="164" fontId="0" fillId="0" borderId="0" xfId="0" applyNumberFormat="1"/>\
+<xf numFmtId="164" fontId="0" fillId="3" borderId="0" xfId="0" applyNumberFormat="1" applyFill="1"/>\
+<xf numFmtId="165" fontId="0" fillId="0" borderId="0" xfId="0" applyNumberFormat="1"/>\
+<xf numFmtId="165" fontId="0" fillId="3" borderId="0" xfId="0" applyNumberFormat="1" applyFill="1"/>\
+</cellXfs>\
+<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>\
+</styleSheet>"""
+
+SHEET_XML = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">\
+<dimension ref="A1:{last_cell}"/>\
+<cols>{cols}</cols>\
+<sheetData>{rows}</sheetData>\
+</worksheet>"""
+
+SHARED_STRINGS_XML = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<sst xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" count="{count}" uniqueCount="{unique}">\
+{items}</sst>"""
+
+
+# Column names A..ZZ, in order
+COLUMN_LETTERS = tuple(ascii_uppercase) + tuple(a + b for a in ascii_uppercase for b in ascii_uppercase)
+
+
+def _column_widths(rows):
+    """Return the padded width of the longest value in each column, capped at 50."""
+    return [min(max(len(str(value)) for value in column if value is not None) + 2, 50)
+            for column in zip(headers, *rows)]
+
+
+def _render_sheet(rows, widths):
+    """Return the sheet1.xml and sharedStrings.xml contents."""
+    strings = {}
+    string_refs = 0
+
+    def text_cell(ref, value, style):
+        nonlocal string_refs
+        string_refs += 1
+        index = strings.setdefault(ILLEGAL_XML_CHARS.sub("", str(value)), len(strings))
+        return f'<c r="{ref}" s="{style}" t="s"><v>{index}</v></c>'
+
+    def number_cell(ref, value, style):
+        # bool is an int subclass but not a number here, and nan/inf have no
+        # cell representation; anything that is not a real number is text
+        if type(value) in (int, float) and math.isfinite(value):
+            return f'<c r="{ref}" s="{style}"><v>{value}</v></c>'
+        return text_cell(ref, value, style)
+
+    def currency_cell(ref, value, style):
+        if isinstance(value, str):
+            try:
+                amount = float(value.strip().lstrip("$").replace(",", ""))
+            except ValueError:
+                amount = None
+            if amount is not None and math.isfinite(amount):
+                value = amount
+        return number_cell(ref, value, style)
+
+    def date_cell(ref, value, style):
+        if isinstance(value, str):
+            try:
+                day = date.fromisoformat(value)
+            except ValueError:
+                day = None
+            if day is not None and day >= FIRST_SERIAL_DATE:
+                value = (day - EXCEL_EPOCH).days
+        return number_cell(ref, value, style)
+
+    writers = {"text": text_cell, "number": number_cell, "currency": currency_cell, "date": date_cell}
+    letters = COLUMN_LETTERS[:len(headers)]
+    columns = [(letter, writers[kind], KIND_STYLES[kind]) for letter, kind in zip(letters, COLUMN_KINDS)]
+
+    cells = "".join(text_cell(f"{letter}1", header, HEADER_STYLE) for letter, header in zip(letters, headers))
+    row_xml = [f'<row r="1">{cells}</row>']
+    for row_num, row in enumerate(rows, 2):
+        # Data rows alternate starting with a shaded one
+        shade = row_num % 2 == 0
+        # Missing values (None, or null in batch JSON) become blank cells that
+        # keep the row's formatting
+        cells = "".join(f'<c r="{letter}{row_num}" s="{styles[shade]}"/>' if value is None
+                        else writer(f"{letter}{row_num}", value, styles[shade])
+                        for (letter, writer, styles), value in zip(columns, row))
+        row_xml.append(f'<row r="{row_num}">{cells}</row>')
+
+    cols = "".join(f'<col min="{col}" max="{col}" width="{width}" customWidth="1"/>'
+                   for col, width in enumerate(widths, 1))
+    sheet = SHEET_XML.format(last_cell=f"{letters[-1]}{len(rows) + 1}", cols=cols, rows="".join(row_xml))
+    shared = SHARED_STRINGS_XML.format(
+        count=string_refs, unique=len(strings),
+        items="".join(f"<si><t>{escape(value)}</t></si>" for value in strings))
+    return sheet, shared
+
+
+def _build(rows, widths):
+    """Render a workbook for rows and return the finished .xlsx bytes."""
+    sheet, shared = _render_sheet(rows, widths)
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, 'w', zipfile.ZIP_DEFLATED, compresslevel=1) as zf:
+        zf.writestr("[Content_Types].xml", CONTENT_TYPES_XML)
+        zf.writestr("_rels/.rels", ROOT_RELS_XML)
+        zf.writestr("xl/workbook.xml", WORKBOOK_XML)
+        zf.writestr("xl/_rels/workbook.xml.rels", WORKBOOK_RELS_XML)
+        zf.writestr("xl/styles.xml", STYLES_XML)
+        zf.writestr("xl/sharedStrings.xml", shared)
+        zf.writestr("xl/worksheets/sheet1.xml", sheet)
+    return buf.getvalue()
+
+
+# The default data never changes, so every write() reuses these bytes
+_CACHED_XLSX = _build(rows, COLUMN_WIDTHS)
+
+
+def _current_umask():
+    """Return the process umask, reading it without changing it where possible."""
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("Umask:"):
+                    return int(line.split()[1], 8)
+    except OSError:
+        pass
+    # Elsewhere the umask can only be read by setting it. The placeholder is
+    # restrictive, so a file another thread creates meanwhile errs private.
+    umask = os.umask(0o077)
+    os.umask(umask)
+    return umask
+
+
+def _replace_file(path, data):
+    """
+    Write data to a temporary file next to path, then rename it into place.
+
+    The rename is atomic within a filesystem, so readers see either the old
+    workbook or the complete new one, never a truncated file.
+    """
+    fd, tmp_path = tempfile.mkstemp(suffix=".xlsx", dir=os.path.dirname(os.path.abspath(path)))
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        # mkstemp creates files private to the owner; give the workbook the
+        # permissions a plain open() would have
+        os.chmod(tmp_path, 0o666 & ~_current_umask())
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def write(path=output_path):
+    """Write the product workbook to path."""
+    _replace_file(path, _CACHED_XLSX)
+
+
+def build(path, rows):
+    """Write a product workbook with the given data rows to path."""
+    for row_num, row in enumerate(rows, 2):
+        if len(row) != len(headers):
+            raise ValueError(f"row {row_num} has {len(row)} values, expected {len(headers)}")
+    _replace_file(path, _build(rows, _column_widths(rows)))
+
+
+def _build_job(job):
+    path, job_rows = job
+    build(path, job_rows)
+    return path
+
+
+def build_many(jobs, max_workers=None):
+    """
+    Build several (path, rows) workbooks across worker processes.
+
+    Rendering is pure Python and holds the GIL, so a batch of exports only
+    scales with cores when each workbook is built in its own process.
+    """
+    with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+        return list(executor.map(_build_job, jobs))
+
+
+if __name__ == "__main__":
+    if "--batch" in sys.argv[1:]:
+        # Jobs are read from stdin as a JSON list of [path, rows] pairs
+        for path in build_many(json.load(sys.stdin)):
+            print(f"Excel file created successfully: {path}")
+    else:
+        # Save the file
+        write()
+        print(f"Excel file created successfully: {output_path}")
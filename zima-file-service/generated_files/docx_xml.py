@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Helpers for emitting a python-docx document body as one XML string.
+
+The city generators use a fixed set of styles, so instead of calling
+add_heading/add_paragraph/add_run per line (each an lxml mutation plus a
+style lookup) they assemble <w:p> fragments as text and swap them into the
+document in a single parse.
+"""
+import io
+import os
+from xml.sax.saxutils import escape
+
+import docx
+from docx import Document
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls
+
+# python-docx's default.docx, read once per process instead of once per document
+_TEMPLATE_PATH = os.path.join(os.path.dirname(docx.__file__), "templates", "default.docx")
+with open(_TEMPLATE_PATH, "rb") as _f:
+    _TEMPLATE_BYTES = _f.read()
+
+
+def fresh_document():
+    """Return a new Document built from the cached default template."""
+    return Document(io.BytesIO(_TEMPLATE_BYTES))
+
+
+def run(text, bold=False):
+    """Return a <w:r> fragment for text, optionally bold."""
+    space = ' xml:space="preserve"' if text != text.strip() else ''
+    props = '<w:rPr><w:b/></w:rPr>' if bold else ''
+    return f'<w:r>{props}<w:t{space}>{escape(text)}</w:t></w:r>'
+
+
+def paragraph(*runs, style=None, center=False):
+    """Return a <w:p> fragment holding the given run fragments."""
+    props = ''
+    if style or center:
+        props = '<w:pPr>'
+        if style:
+            props += f'<w:pStyle w:val="{style}"/>'
+        if center:
+            props += '<w:jc w:val="center"/>'
+        props += '</w:pPr>'
+    return f'<w:p>{props}{"".join(runs)}</w:p>'
+
+
+def parse_body(fragments):
+    """Parse paragraph fragments into a detached <w:body> element."""
+    return parse_xml(f'<w:body {nsdecls("w")}>{"".join(fragments)}</w:body>')
+
+
+def install_body(doc, new_body):
+    """Swap new_body in as the body of doc, keeping the template's sectPr."""
+    body = doc.element.body
+    if body.sectPr is not None:
+        new_body.append(body.sectPr)
+    body.getparent().replace(body, new_body)
+
+
+def replace_body(doc, fragments):
+    """Replace the body of doc with the paragraph fragments."""
+    install_body(doc, parse_body(fragments))
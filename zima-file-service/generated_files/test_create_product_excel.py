@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Round-trip tests for create_product_excel.py.
+
+The workbook parts are written by hand, so these load the output with
+openpyxl and check the values and formatting it reads back.
+"""
+import os
+import sys
+import tempfile
+import unittest
+from datetime import datetime
+
+import openpyxl
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import create_product_excel as product_excel
+
+SHADED = "FFF2F2F2"
+
+
+def _fill(cell):
+    return cell.fill.fgColor.rgb if cell.fill.fill_type == "solid" else None
+
+
+class ProductExcelTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def load(self, name, rows=None):
+        path = os.path.join(self.tmp.name, name)
+        if rows is None:
+            product_excel.write(path)
+        else:
+            product_excel.build(path, rows)
+        return openpyxl.load_workbook(path).active
+
+    def test_write_round_trips(self):
+        ws = self.load("product_data.xlsx")
+
+        self.assertEqual(ws.title, "Product Data")
+        self.assertEqual(next(ws.values), product_excel.headers)
+        first = [cell.value for cell in ws[2]]
+        self.assertEqual(first, ["P001", "Laptop Computer", "Electronics", 1299.99, 45, "TechCorp",
+                                 datetime(2026, 1, 15)])
+        self.assertEqual(ws.max_row, len(product_excel.rows) + 1)
+        self.assertEqual(ws.max_column, len(product_excel.headers))
+
+        for cell in ws[1]:
+            self.assertTrue(cell.font.b)
+            self.assertEqual(cell.font.color.rgb, "FFFFFFFF")
+            self.assertEqual(cell.fill.fgColor.rgb, "FF4472C4")
+            self.assertEqual(cell.alignment.horizontal, "center")
+            self.assertEqual(cell.alignment.vertical, "center")
+
+        self.assertTrue(all(_fill(cell) == SHADED for cell in ws[2]))
+        self.assertTrue(all(_fill(cell) is None for cell in ws[3]))
+
+        self.assertEqual(ws["D2"].number_format, '"$"#,##0.00')
+        self.assertEqual(ws["G2"].number_format, "yyyy-mm-dd")
+        self.assertEqual(ws["E2"].number_format, "General")
+
+        widths = [ws.column_dimensions[letter].width for letter in "ABCDEFG"]
+        self.assertEqual(widths, list(product_excel.COLUMN_WIDTHS))
+
+    def test_build_matches_write_for_default_rows(self):
+        written = self.load("written.xlsx")
+        built = self.load("built.xlsx", product_excel.rows)
+        self.assertEqual(list(built.values), list(written.values))
+        widths = [built.column_dimensions[letter].width for letter in "ABCDEFG"]
+        self.assertEqual(widths, list(product_excel.COLUMN_WIDTHS))
+
+    def test_build_keeps_unconvertible_values_as_text(self):
+        ws = self.load("mixed.xlsx", [
+            (1, "Widget", "Tools", "$1,299.99", "N/A", "Acme", "2026-02-01"),
+            ("P2", "Gadget", "Tools", "free", True, "Acme", "soon"),
+            ("P3\x01", "Tab\tbed\x1f", "Tools", "$5", 1, "Acme\x0b", "2020-01-01"),
+        ])
+        self.assertEqual([cell.value for cell in ws[2]],
+                         ["1", "Widget", "Tools", 1299.99, "N/A", "Acme", datetime(2026, 2, 1)])
+        self.assertEqual([cell.value for cell in ws[3]],
+                         ["P2", "Gadget", "Tools", "free", "True", "Acme", "soon"])
+        # XML-illegal control characters are dropped; tab is legal and kept
+        self.assertEqual([cell.value for cell in ws[4]],
+                         ["P3", "Tab\tbed", "Tools", 5, 1, "Acme", datetime(2020, 1, 1)])
+
+    def test_build_keeps_dates_before_march_1900_as_text(self):
+        ws = self.load("dates.xlsx", [
+            ("P1", "a", "x", "$5", 1, "A", "1900-01-15"),
+            ("P2", "a", "x", "$5", 1, "A", "1899-12-31"),
+            ("P3", "a", "x", "$5", 1, "A", "1900-03-01"),
+        ])
+        self.assertEqual([row[0].value for row in ws["G2:G4"]],
+                         ["1900-01-15", "1899-12-31", datetime(1900, 3, 1)])
+
+    def test_build_shades_blank_cells(self):
+        ws = self.load("blank.xlsx", [("P1", None, "Tools", None, 3, "Acme", None)])
+        self.assertEqual([cell.value for cell in ws[2]], ["P1", None, "Tools", None, 3, "Acme", None])
+        self.assertTrue(all(_fill(cell) == SHADED for cell in ws[2]))
+        self.assertEqual(ws["D2"].number_format, '"$"#,##0.00')
+
+    def test_build_sizes_columns_from_rows(self):
+        ws = self.load("wide.xlsx", [("P1", "x" * 80, "Tools", 1.5, 3, "Acme", "2026-02-01")])
+        self.assertEqual(ws.column_dimensions["A"].width, len("Product ID") + 2)
+        self.assertEqual(ws.column_dimensions["B"].width, 50)
+
+    def test_build_rejects_rows_of_the_wrong_length(self):
+        path = os.path.join(self.tmp.name, "short.xlsx")
+        with self.assertRaises(ValueError):
+            product_excel.build(path, [("a", "b")])
+        self.assertFalse(os.path.exists(path))
+
+
+if __name__ == "__main__":
+    unittest.main()
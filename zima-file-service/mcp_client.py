@@ -0,0 +1,335 @@
+#!/usr/bin/env python3
+"""
+Persistent MCP client for the zima-file-service stdio server.
+
+Starting `dotnet run` costs seconds, so scripts share one long-lived server
+process per interpreter: the initialize handshake and assembly load happen
+once and every later tools/call reuses the same pipes.
+"""
+import atexit
+import json
+import os
+import queue
+import selectors
+import subprocess
+import sys
+from concurrent.futures import Future, ThreadPoolExecutor
+
+# orjson serializes straight to bytes in C; the stdlib json is the fallback
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+else:
+    def _dumps(obj):
+        return json.dumps(obj).encode()
+    _loads = json.loads
+
+PROJECT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Maximum number of tools/call requests written ahead of their responses
+PIPELINE_DEPTH = 16
+
+# User-space buffer in front of the server's stdin pipe
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Kernel pipe capacity requested on Linux (the default is 64 KiB), so a full
+# pipelined batch fits in the pipe without blocking on the reader
+PIPE_SIZE = 1 << 20
+F_SETPIPE_SZ = 1031
+
+# Scratch serialization buffers that grow past this are released after use
+SOFT_MAX_BUFFER_LEN = 128 * 1024
+
+# Bytes read from the server's stdout/stderr per ready event
+READ_CHUNK_SIZE = 65536
+
+# Seconds between liveness checks while waiting on the server
+SELECT_TIMEOUT = 5
+
+INIT_REQUEST = {
+    "jsonrpc": "2.0",
+    "id": 0,
+    "method": "initialize",
+    "params": {
+        "protocolVersion": "2024-11-05",
+        "clientInfo": {
+            "name": "zima-python-client",
+            "version": "1.0.0"
+        }
+    }
+}
+
+INITIALIZED_NOTIFICATION = {
+    "jsonrpc": "2.0",
+    "method": "notifications/initialized"
+}
+
+
+class McpClient:
+    """A single MCP server process speaking JSON-RPC over stdin/stdout."""
+
+    def __init__(self, command=None, cwd=PROJECT_DIR):
+        self.command = command or ["dotnet", "run", "--no-build"]
+        self.cwd = cwd
+        self.proc = None
+        self.init_response = None
+        self._next_id = 1
+        self._wbuf = bytearray()
+        self._rbuf = bytearray()
+        self._selector = None
+        self._inflight = {}
+
+    def __enter__(self):
+        return self.open()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def open(self):
+        if self.proc is not None:
+            return self
+
+        self.proc = subprocess.Popen(self.command,
+                                     cwd=self.cwd,
+                                     stdin=subprocess.PIPE,
+                                     stdout=subprocess.PIPE,
+                                     stderr=subprocess.PIPE,
+                                     bufsize=WRITE_BUFFER_SIZE)
+        self._grow_pipes()
+
+        # stdout and stderr are both drained as data arrives, so server logging
+        # can never fill a pipe and stall a response.
+        self._selector = selectors.DefaultSelector()
+        self._selector.register(self.proc.stdout, selectors.EVENT_READ, "out")
+        self._selector.register(self.proc.stderr, selectors.EVENT_READ, "err")
+
+        # The server handles lines in order, so the initialized notification
+        # can go out in the same write as initialize.
+        init = self._expect(INIT_REQUEST["id"])
+        self._send([INIT_REQUEST, INITIALIZED_NOTIFICATION])
+        self.init_response = self._wait(init)
+        return self
+
+    def close(self):
+        if self.proc is None:
+            return
+        self._selector.close()
+        self._selector = None
+        try:
+            # Closes stdin, then drains the remaining output until the server exits
+            self.proc.communicate()
+        except OSError:
+            self.proc.wait()
+        self.proc = None
+        self._rbuf = bytearray()
+        self._inflight = {}
+
+    def call_tool(self, name, arguments):
+        """Invoke one tool and return the decoded JSON-RPC response."""
+        return self.call_tools([(name, arguments)])[0]
+
+    def call_tools(self, calls, pipeline=PIPELINE_DEPTH):
+        """Invoke several (name, arguments) tools, returning responses in order."""
+        requests = [self.tool_request(name, arguments) for name, arguments in calls]
+        results = self.send_batch(requests, pipeline)
+        return [results[request["id"]] for request in requests]
+
+    def tool_request(self, name, arguments):
+        """Build a tools/call request carrying the next free id."""
+        request = {
+            "jsonrpc": "2.0",
+            "id": self._next_id,
+            "method": "tools/call",
+            "params": {
+                "name": name,
+                "arguments": arguments
+            }
+        }
+        self._next_id += 1
+        return request
+
+    def call_tool_raw(self, name, arguments, raw_key, raw_json):
+        """
+        Invoke a tool with one argument supplied as pre-serialized JSON.
+
+        raw_json is bytes, a bytearray or an mmap of a .json file. It is
+        spliced into the request as `raw_key` without being decoded, and must
+        hold a single line (no CR or LF) since the server reads one message
+        per line.
+        """
+        self.open()
+        end = len(raw_json)
+        while end and raw_json[end - 1] in b" \t\r\n":
+            end -= 1
+        # The server's StreamReader.ReadLine ends a line at \r as well as \n
+        if raw_json.find(b"\n", 0, end) != -1 or raw_json.find(b"\r", 0, end) != -1:
+            raise ValueError("raw JSON argument must be on a single line")
+
+        request_id = self._next_id
+        self._next_id += 1
+        head = b'{"jsonrpc":"2.0","id":%d,"method":"tools/call","params":{"name":%s,"arguments":%s' % (
+            request_id, _dumps(name), _dumps(arguments)[:-1])
+        separator = b"," if arguments else b""
+        future = self._expect(request_id)
+        with memoryview(raw_json)[:end] as raw:
+            self.proc.stdin.write(b"".join((head, separator, _dumps(raw_key), b":", raw, b"}}}\n")))
+        self.proc.stdin.flush()
+        return self._wait(future)
+
+    def send_batch(self, requests, pipeline=PIPELINE_DEPTH):
+        """
+        Pipeline requests to the server and collect the responses by id.
+
+        Up to `pipeline` requests are serialized back-to-back into one write before
+        blocking on a response, so the per-message round trip is paid once per
+        window rather than once per request.
+        """
+        self.open()
+        futures = {}
+        pos = 0
+
+        while pos < len(requests) or self._inflight:
+            if pos < len(requests) and len(self._inflight) < pipeline:
+                batch = requests[pos:pos + pipeline - len(self._inflight)]
+                pos += len(batch)
+                for request in batch:
+                    futures[request["id"]] = self._expect(request["id"])
+                self._send(batch)
+            else:
+                self._poll()
+
+        return {request_id: future.result() for request_id, future in futures.items()}
+
+    def _grow_pipes(self):
+        if not sys.platform.startswith("linux"):
+            return
+        import fcntl
+        for pipe in (self.proc.stdin, self.proc.stdout, self.proc.stderr):
+            try:
+                fcntl.fcntl(pipe.fileno(), F_SETPIPE_SZ, PIPE_SIZE)
+            except OSError:
+                # Capped by /proc/sys/fs/pipe-max-size; the default still works
+                pass
+
+    def _send(self, messages):
+        """Serialize messages into one buffer and hand it to the pipe in one write."""
+        buf = self._wbuf
+        del buf[:]
+        for message in messages:
+            buf += _dumps(message)
+            buf += b"\n"
+        self.proc.stdin.write(buf)
+        self.proc.stdin.flush()
+        if len(buf) > SOFT_MAX_BUFFER_LEN:
+            self._wbuf = bytearray()
+
+    def _expect(self, request_id):
+        """Register a future to be fulfilled by the response carrying request_id."""
+        future = Future()
+        self._inflight[request_id] = future
+        return future
+
+    def _wait(self, future):
+        while not future.done():
+            self._poll()
+        return future.result()
+
+    def _poll(self):
+        """Wait for output from the server and dispatch whatever has arrived."""
+        events = self._selector.select(timeout=SELECT_TIMEOUT)
+        if not events and self.proc.poll() is not None:
+            raise RuntimeError(f"MCP server exited with code {self.proc.returncode}")
+
+        for key, _ in events:
+            data = os.read(key.fd, READ_CHUNK_SIZE)
+            if key.data == "err":
+                if data:
+                    sys.stderr.write(data.decode("utf-8", "replace"))
+                else:
+                    self._selector.unregister(key.fileobj)
+                continue
+
+            if not data:
+                raise RuntimeError("MCP server closed its output stream")
+            buf = self._rbuf
+            buf += data
+            start = 0
+            while (end := buf.find(b"\n", start)) != -1:
+                self._dispatch(_loads(buf[start:end]))
+                start = end + 1
+            del buf[:start]
+
+    def _dispatch(self, response):
+        request_id = response.get("id")
+        if request_id is None and self._inflight:
+            # Parse errors come back without an id; the server answers lines in
+            # order, so they belong to the oldest outstanding request.
+            request_id = next(iter(self._inflight))
+        future = self._inflight.pop(request_id, None)
+        if future is None:
+            sys.stderr.write(f"[MCP] Unexpected response: {response}\n")
+            return
+        future.set_result(response)
+
+
+class McpPool:
+    """
+    Several MCP server processes for generating independent documents in parallel.
+
+    Each client serves one call at a time; threads borrow an idle client from
+    the queue and return it when their call completes.
+    """
+
+    def __init__(self, size=None, **client_kwargs):
+        size = size or max(1, (os.cpu_count() or 2) // 2)
+        self.clients = [McpClient(**client_kwargs) for _ in range(size)]
+        self._idle = queue.Queue()
+        for client in self.clients:
+            self._idle.put(client)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self):
+        for client in self.clients:
+            client.close()
+
+    def call(self, name, arguments):
+        """Invoke one tool on the next idle server."""
+        client = self._idle.get()
+        try:
+            return client.call_tool(name, arguments)
+        finally:
+            self._idle.put(client)
+
+    def call_many(self, calls):
+        """Invoke (name, arguments) tools across all servers, returning responses in order."""
+        with ThreadPoolExecutor(len(self.clients)) as executor:
+            return list(executor.map(lambda call: self.call(*call), calls))
+
+
+_client = None
+
+
+def get_client():
+    """Return the process-wide client, starting the server on first use."""
+    global _client
+    if _client is None:
+        _client = McpClient().open()
+        atexit.register(_client.close)
+    return _client
+
+
+def tool_text(response):
+    """Extract the text payload of a tools/call response, or None on error."""
+    if 'result' not in response:
+        return None
+    return response['result']['content'][0]['text']
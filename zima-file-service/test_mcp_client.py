@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Tests for mcp_client.py against a stand-in server.
+
+FAKE_SERVER speaks the same line-delimited JSON-RPC as the dotnet server, so
+pipelining, line reassembly, stderr draining and error routing are exercised
+without a .NET toolchain.
+"""
+import contextlib
+import io
+import json
+import mmap
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from mcp_client import McpClient, McpPool, tool_text
+
+# Tools: "echo" returns its arguments as JSON text, "noise" writes to stderr
+# before echoing, "exit" stops the server without replying. Unparseable lines
+# get an id-less parse error, as the real server sends.
+FAKE_SERVER = r'''
+import json
+import sys
+
+out = sys.stdout
+for line in sys.stdin.buffer:
+    try:
+        request = json.loads(line)
+    except ValueError:
+        out.write(json.dumps({"jsonrpc": "2.0", "id": None,
+                              "error": {"code": -32700, "message": "Parse error"}}) + "\n")
+        out.flush()
+        continue
+    if "id" not in request:
+        continue
+    sys.stderr.write("handling %s\n" % request["method"])
+    if request["method"] != "tools/call":
+        result = {"protocolVersion": "2024-11-05"}
+    else:
+        name = request["params"]["name"]
+        arguments = request["params"]["arguments"]
+        if name == "exit":
+            sys.exit(3)
+        if name == "noise":
+            sys.stderr.write("x" * arguments["bytes"] + "\n")
+        result = {"content": [{"type": "text", "text": json.dumps(arguments)}]}
+    out.write(json.dumps({"jsonrpc": "2.0", "id": request["id"], "result": result}) + "\n")
+    out.flush()
+'''
+
+FAKE_COMMAND = [sys.executable, "-c", FAKE_SERVER]
+
+
+def echoed(response):
+    return json.loads(tool_text(response))
+
+
+class McpClientTest(unittest.TestCase):
+
+    def setUp(self):
+        # The client forwards server stderr to sys.stderr; keep it for assertions
+        self.stderr = io.StringIO()
+        redirect = contextlib.redirect_stderr(self.stderr)
+        redirect.__enter__()
+        self.addCleanup(redirect.__exit__, None, None, None)
+
+        self.client = McpClient(command=FAKE_COMMAND).open()
+        self.addCleanup(self.client.close)
+
+    def test_initialize(self):
+        self.assertEqual(self.client.init_response["id"], 0)
+        self.assertIn("handling initialize", self.stderr.getvalue())
+
+    def test_pipelined_calls_return_in_order(self):
+        calls = [("echo", {"n": n}) for n in range(50)]
+        responses = self.client.call_tools(calls)
+        self.assertEqual([echoed(response)["n"] for response in responses], list(range(50)))
+        self.assertEqual(len({response["id"] for response in responses}), 50)
+
+    def test_large_argument(self):
+        # Several megabytes in both directions, arriving over many reads
+        payload = "y" * (3 << 20)
+        self.assertEqual(echoed(self.client.call_tool("echo", {"data": payload}))["data"], payload)
+
+    def test_stderr_is_drained(self):
+        response = self.client.call_tool("noise", {"bytes": 4 << 20})
+        self.assertEqual(echoed(response), {"bytes": 4 << 20})
+        self.assertIn("x" * 1000, self.stderr.getvalue())
+
+    def test_call_tool_raw_with_mmap(self):
+        content = [{"type": "paragraph", "text": "café"}]
+        with tempfile.TemporaryFile() as f:
+            f.write(json.dumps(content).encode() + b"\n")
+            f.flush()
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as raw:
+                response = self.client.call_tool_raw("echo", {"filename": "a.docx"}, "content", raw)
+        self.assertEqual(echoed(response), {"filename": "a.docx", "content": content})
+
+    def test_call_tool_raw_with_empty_arguments(self):
+        response = self.client.call_tool_raw("echo", {}, "content", b'[1, 2]  \r\n')
+        self.assertEqual(echoed(response), {"content": [1, 2]})
+
+    def test_call_tool_raw_rejects_line_breaks(self):
+        for raw in (b'[1,\n2]', b'[1,\r2]'):
+            with self.assertRaises(ValueError):
+                self.client.call_tool_raw("echo", {}, "content", raw)
+        # Nothing was sent, so the connection is still usable
+        self.assertEqual(echoed(self.client.call_tool("echo", {"ok": True})), {"ok": True})
+
+    def test_parse_error_goes_to_its_request(self):
+        response = self.client.call_tool_raw("echo", {}, "content", b'{not json')
+        self.assertEqual(response["error"]["code"], -32700)
+        self.assertEqual(echoed(self.client.call_tool("echo", {"after": 1})), {"after": 1})
+
+    def test_server_exit_raises(self):
+        with self.assertRaises(RuntimeError):
+            self.client.call_tool("exit", {})
+
+
+class McpPoolTest(unittest.TestCase):
+
+    def test_call_many(self):
+        with contextlib.redirect_stderr(io.StringIO()), McpPool(size=3, command=FAKE_COMMAND) as pool:
+            responses = pool.call_many([("echo", {"n": n}) for n in range(20)])
+            self.assertEqual([echoed(response)["n"] for response in responses], list(range(20)))
+            self.assertEqual(pool._idle.qsize(), len(pool.clients))
+
+
+if __name__ == "__main__":
+    unittest.main()